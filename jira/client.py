@@ -9,6 +9,7 @@ at: https://jira.readthedocs.io/en/latest/.
 from __future__ import annotations
 
 import calendar
+import concurrent.futures
 import copy
 import datetime
 import hashlib
@@ -96,7 +97,7 @@ from jira.resources import (
     WorkflowScheme,
     Worklog,
 )
-from jira.utils import json_loads, remove_empty_attributes, threaded_requests
+from jira.utils import json_loads, remove_empty_attributes
 
 try:
     from requests_jwt import JWTAuth
@@ -974,18 +975,29 @@ class JIRA:
         resource.find(ids)
         return resource
 
-    @no_type_check  # FIXME: This function fails type checking, probably a bug or two
     def async_do(self, size: int = 10):
-        """Execute all asynchronous jobs and wait for them to finish. By default it will run on 10 threads.
+        """Wait for all asynchronous jobs to finish.
+
+        The jobs are run as they are queued, on up to ``async_workers`` threads.
 
         Args:
-            size (int): number of threads to run on.
+            size (int): DEPRECATED, unused: the number of threads is set by the ``async_workers`` option.
         """
-        if hasattr(self._session, "_async_jobs"):
-            self.log.info(
-                f"Executing asynchronous {len(self._session._async_jobs)} jobs found in queue by using {size} threads..."
+        if size != 10:
+            warnings.warn(
+                "'size' is ignored by async_do() and will be removed in future releases. "
+                "Use the 'async_workers' option instead.",
+                DeprecationWarning,
+                stacklevel=2,
             )
-            threaded_requests.map(self._session._async_jobs, size=size)
+        jobs = getattr(getattr(self, "_session", None), "_async_jobs", None)
+        if jobs:
+            self.log.info(f"Waiting for {len(jobs)} asynchronous jobs to finish...")
+            done, _ = concurrent.futures.wait(list(jobs))
+            jobs.difference_update(done)
+            for job in done:
+                if job.exception() is not None:
+                    self.log.error(f"Asynchronous job failed: {job.exception()}")
 
             # Application properties
 
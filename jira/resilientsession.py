@@ -5,6 +5,7 @@ import json
 import logging
 import random
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from http import HTTPStatus
 from typing import Any
 
@@ -162,6 +163,10 @@ class ResilientSession(Session):
         self.max_retry_delay = max_retry_delay
         super().__init__()
 
+        # Requests running in the background, see JIRA.async_do()
+        self._async_jobs: set[Future] = set()
+        self._async_executor: ThreadPoolExecutor | None = None
+
         # Indicate our preference for JSON to avoid https://bitbucket.org/bspeakmon/jira-python/issue/46 and https://jira.atlassian.com/browse/JRA-38551
         self.headers.update({"Accept": "application/json,*/*;q=0.9"})
 
@@ -251,6 +256,37 @@ class ResilientSession(Session):
             # Shouldn't reach here...(but added for mypy's benefit)
             raise RuntimeError("Expected a Response or Exception to raise!")
 
+    def _submit_async(
+        self, method: str, url: str, max_workers: int | None = None, **kwargs
+    ) -> Future:
+        """Run a request in the background, on a bounded pool of worker threads.
+
+        The future of the request is added to the jobs that :py:meth:`jira.client.JIRA.async_do` waits for.
+
+        Args:
+            method (str): The HTTP method of the request.
+            url (str): The url of the request.
+            max_workers (Optional[int]): Number of worker threads, used when the pool is first created.
+            kwargs: Keyword arguments passed to :py:meth:`request`.
+
+        Returns:
+            Future: The future of the Response.
+        """
+        if self._async_executor is None:
+            self._async_executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="jira-async"
+            )
+        future = self._async_executor.submit(self.request, method, url, **kwargs)
+        self._async_jobs.add(future)
+        return future
+
+    def close(self):
+        """Stop the pool of background requests, then close the session."""
+        if self._async_executor is not None:
+            self._async_executor.shutdown(wait=False)
+            self._async_executor = None
+        super().close()
+
     def __handle_known_ok_response_errors(self, response: Response):
         """Responses that report ok may also have errors.
 
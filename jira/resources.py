@@ -6,17 +6,18 @@ resources into usable objects.
 
 from __future__ import annotations
 
-import json
 import logging
 import re
+import sys
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Type, cast
+from functools import cached_property, lru_cache, wraps
+from typing import TYPE_CHECKING, Any
 
 from requests import Response
 from requests.structures import CaseInsensitiveDict
 
 from jira.resilientsession import ResilientSession, parse_errors
-from jira.utils import json_loads, remove_empty_attributes, threaded_requests
+from jira.utils import json_dumps, json_loads
 
 if TYPE_CHECKING:
     from jira.client import JIRA
@@ -73,6 +74,10 @@ __all__ = (
 
 logging.getLogger("jira").addHandler(logging.NullHandler())
 
+# Error messages returned by Jira that the autofix logic in Resource.update() handles
+_USER_NOT_FOUND_RE = re.compile(r"^User '(.*)' was not found in the system\.", re.U)
+_USER_DOES_NOT_EXIST_RE = re.compile(r"^User '(.*)' does not exist\.")
+
 
 class Resource:
     """Models a URL-addressable resource in the Jira REST API.
@@ -98,6 +103,19 @@ class Resource:
 
     JIRA_BASE_URL = "{server}/rest/{rest_path}/{rest_api_version}/{path}"
 
+    # The attributes every resource has are stored in slots. The properties parsed
+    # from the raw json are arbitrary, so they still need a __dict__.
+    __slots__ = (
+        "_resource",
+        "_options",
+        "_session",
+        "_base_url",
+        "_cached_hash",
+        "_cached_hash_ids",
+        "raw",
+        "__dict__",
+    )
+
     # A prioritized list of the keys in self.raw most likely to contain a
     # human readable name or identifier, or that offer other key information.
     _READABLE_IDS = (
@@ -113,6 +131,7 @@ class Resource:
         "mimeType",
         "closed",
     )
+    _READABLE_IDS_SET = frozenset(_READABLE_IDS)
 
     # A list of properties that should uniquely identify a Resource object.
     # Each of these properties should be hashable, usually strings
@@ -130,6 +149,7 @@ class Resource:
         options: dict[str, Any],
         session: ResilientSession,
         base_url: str = JIRA_BASE_URL,
+        raw: dict[str, Any] | None = None,
     ):
         """Initializes a generic resource.
 
@@ -138,15 +158,20 @@ class Resource:
             options (Dict[str,str]): Options for the new resource
             session (ResilientSession): Session used for the resource.
             base_url (Optional[str]): The Base Jira url.
+            raw (Optional[Dict[str, Any]]): The raw json to load the resource from. Defaults to None.
 
         """
         self._resource = resource
         self._options = options
         self._session = session
         self._base_url = base_url
+        self._cached_hash: int | None = None
+        self._cached_hash_ids: tuple[str, ...] = ()
 
         # Explicitly define as None, so we know when a resource has actually been loaded
         self.raw: dict[str, Any] | None = None
+        if raw:
+            self._parse_raw(raw)
 
     def __str__(self) -> str:
         """Return the first value we find that is likely to be human-readable.
@@ -159,7 +184,7 @@ class Resource:
                 if name in self.raw:
                     pretty_name = str(self.raw[name])
                     # Include any child to support nested select fields.
-                    if hasattr(self, "child"):
+                    if "child" in self.__dict__:
                         pretty_name += " - " + str(self.child)
                     return pretty_name
 
@@ -172,11 +197,9 @@ class Resource:
         Returns:
             str
         """
-        names: list[str] = []
-        if self.raw:
-            for name in self._READABLE_IDS:
-                if name in self.raw:
-                    names.append(name + "=" + repr(self.raw[name]))
+        raw = self.raw or {}
+        keys = self._READABLE_IDS_SET & raw.keys()
+        names = [f"{name}={raw[name]!r}" for name in self._READABLE_IDS if name in keys]
         if not names:
             return f"<JIRA {self.__class__.__name__} at {id(self)}>"
         return f"<JIRA {self.__class__.__name__}: {', '.join(names)}>"
@@ -193,24 +216,28 @@ class Resource:
         Returns:
             Any: Attribute value.
         """
-        try:
-            return self[item]  # type: ignore
-        except Exception as e:
-            if hasattr(self, "raw") and self.raw is not None and item in self.raw:
-                return self.raw[item]
-            else:
-                raise AttributeError(
-                    f"{self.__class__!r} object has no attribute {item!r} ({e})"
-                )
+        # 'raw' is only missing while unpickling, don't recurse back into __getattr__
+        raw = self.raw if item != "raw" else None
+        if raw is not None and item in raw:
+            return raw[item]
+        raise AttributeError(f"{self.__class__!r} object has no attribute {item!r}")
 
     def __getstate__(self) -> dict[str, Any]:
         """Pickling the resource."""
-        return vars(self)
+        state = dict(vars(self))
+        for name in Resource.__slots__[:-1]:  # all but __dict__
+            if hasattr(self, name):
+                state[name] = getattr(self, name)
+        return state
 
     def __setstate__(self, raw_pickled: dict[str, Any]):
         """Unpickling of the resource."""
         # https://stackoverflow.com/a/50888571/7724187
-        vars(self).update(raw_pickled)
+        self.raw = None
+        for name, value in raw_pickled.items():
+            setattr(self, name, value)
+        # str hashes are salted per process, so the pickled hash can't be reused
+        self._cache_hash()
 
     def __hash__(self) -> int:
         """Hash calculation.
@@ -218,13 +245,12 @@ class Resource:
         We try to find unique identifier like properties to form our hash object.
         Technically 'self', if present, is the unique URL to the object, and should be sufficient to generate a unique hash.
         """
-        hash_list = []
-        for a in self._HASH_IDS:
-            if hasattr(self, a):
-                hash_list.append(getattr(self, a))
+        if self._cached_hash is not None:
+            return self._cached_hash
 
-        if hash_list:
-            return hash(tuple(hash_list))
+        hash_values = self._hash_values()
+        if hash_values:
+            return hash(hash_values)
         else:
             raise TypeError(f"'{self.__class__}' is not hashable")
 
@@ -233,14 +259,48 @@ class Resource:
 
         Checks the types look about right and that the relevant attributes that uniquely identify a resource are equal.
         """
-        return isinstance(other, self.__class__) and all(
-            [
-                getattr(self, a) == getattr(other, a)
-                for a in self._HASH_IDS
-                if hasattr(self, a)
-            ]
+        if not isinstance(other, self.__class__):
+            return False
+        # Different hashes only rule out equality when both were computed from
+        # the same identifiers, as only the ones present on self are compared
+        if (
+            type(self) is type(other)
+            and self._cached_hash is not None
+            and other._cached_hash is not None
+            and self._cached_hash != other._cached_hash
+            and self._cached_hash_ids == other._cached_hash_ids
+        ):
+            return False
+        return all(
+            getattr(self, a) == getattr(other, a)
+            for a in self._HASH_IDS
+            if hasattr(self, a)
         )
 
+    def _hash_values(self) -> tuple[Any, ...]:
+        """The values of the attributes in ``_HASH_IDS`` that this resource has.
+
+        Returns:
+            Tuple[Any, ...]
+        """
+        attrs = self.__dict__
+        return tuple(attrs[a] for a in self._HASH_IDS if a in attrs)
+
+    def _cache_hash(self):
+        """Compute the hash once the identifying attributes are known.
+
+        Resources are not expected to change after they are parsed, so ``__hash__``
+        can reuse this value instead of looking up every attribute again.
+        """
+        attrs = self.__dict__
+        self._cached_hash_ids = tuple(a for a in self._HASH_IDS if a in attrs)
+        hash_values = tuple(attrs[a] for a in self._cached_hash_ids)
+        try:
+            self._cached_hash = hash(hash_values) if hash_values else None
+        except TypeError:
+            # Unhashable values, leave it to __hash__() to raise when it is used
+            self._cached_hash = None
+
     def find(
         self,
         id: tuple[str, ...] | int | str,
@@ -287,16 +347,31 @@ class Resource:
         Returns:
             str
         """
+        if self._base_url.endswith("{path}"):
+            return self._url_prefix + path
         options = self._options.copy()
         options.update({"path": path})
         return self._base_url.format(**options)
 
+    @cached_property
+    def _url_prefix(self) -> str:
+        """The base url formatted with the options, up to where the path is inserted.
+
+        The options relevant to the base url do not change during a session, so this is
+        computed once per resource instead of on every call to ``_get_url()``.
+
+        Returns:
+            str
+        """
+        return self._base_url.partition("{path}")[0].format(**self._options)
+
     def update(
         self,
         fields: dict[str, Any] | None = None,
         async_: bool | None = None,
         jira: JIRA = None,
         notify: bool = True,
+        reload: bool = True,
         **kwargs: Any,
     ):
         """Update this resource on the server.
@@ -306,10 +381,13 @@ class Resource:
 
         Args:
             fields (Optional[Dict[str, Any]]): Fields which should be updated for the object.
-            async_ (Optional[bool]): True to add the request to the queue, so it can be executed later using async_run()
+            async_ (Optional[bool]): True to send the request in the background on the session's thread pool,
+              :py:meth:`jira.client.JIRA.async_do` waits for it to finish
             jira (jira.client.JIRA): Instance of Jira Client
             notify (bool): True to notify watchers about the update, sets parameter notifyUsers. (Default: ``True``).
               Admin or project admin permissions are required to disable the notification.
+            reload (bool): True to load the updated resource from the server afterwards. (Default: ``True``).
+              If False, ``raw`` and the attributes are left as they were before the update.
             kwargs (Any): extra arguments to the PUT request.
         """
         if async_ is None:
@@ -325,9 +403,11 @@ class Resource:
         else:
             querystring = ""
 
-        r = self._session.put(self.self + querystring, data=json.dumps(data))
-        if "autofix" in self._options and r.status_code == 400:
+        r = self._session.put(self.self + querystring, data=json_dumps(data))
+        if r.status_code == 400 and "autofix" in self._options:
             user = None
+            # Only retry the update if one of the errors could be fixed
+            retry = False
             error_list = parse_errors(r)
             logging.error(error_list)
             if (
@@ -339,6 +419,7 @@ class Resource:
                     % self._options["autofix"]
                 )
                 data["fields"]["reporter"] = {"name": self._options["autofix"]}
+                retry = True
 
             if (
                 "Issues must be assigned." in error_list
@@ -350,6 +431,7 @@ class Resource:
                     )
                 )
                 data["fields"]["assignee"] = {"name": self._options["autofix"]}
+                retry = True
 
             if (
                 "Issue type is a sub-task but parent issue key or id not specified."
@@ -359,29 +441,21 @@ class Resource:
                     "autofix: trying to fix sub-task without parent by converting to it to bug"
                 )
                 data["fields"]["issuetype"] = {"name": "Bug"}
+                retry = True
             if (
                 "The summary is invalid because it contains newline characters."
                 in error_list
             ):
                 logging.warning("autofix: trying to fix newline in summary")
                 data["fields"]["summary"] = self.fields.summary.replace("/n", "")
+                retry = True
             for error in error_list:
-                if re.search(
-                    r"^User '(.*)' was not found in the system\.", error, re.U
-                ):
-                    m = re.search(
-                        r"^User '(.*)' was not found in the system\.", error, re.U
-                    )
-                    if m:
-                        user = m.groups()[0]
-                    else:
-                        raise NotImplementedError()
-                if re.search(r"^User '(.*)' does not exist\.", error):
-                    m = re.search(r"^User '(.*)' does not exist\.", error)
-                    if m:
-                        user = m.groups()[0]
-                    else:
-                        raise NotImplementedError()
+                m = _USER_NOT_FOUND_RE.match(error)
+                if m:
+                    user = m.group(1)
+                m = _USER_DOES_NOT_EXIST_RE.match(error)
+                if m:
+                    user = m.group(1)
 
             if user and jira:
                 logging.warning(
@@ -389,23 +463,24 @@ class Resource:
                     % user
                 )
                 jira.add_user(user, "noreply@example.com", 10100, active=False)
+                retry = True
                 # if 'assignee' not in data['fields']:
                 #    logging.warning("autofix: setting assignee to '%s' and retrying the update." % self._options['autofix'])
                 #    data['fields']['assignee'] = {'name': self._options['autofix']}
             # EXPERIMENTAL --->
-            if async_:  # FIXME: no async
-                if not hasattr(self._session, "_async_jobs"):
-                    self._session._async_jobs = set()  # type: ignore
-                self._session._async_jobs.add(  # type: ignore
-                    threaded_requests.put(  # type: ignore
-                        self.self, data=json.dumps(data)
-                    )
+            if retry and async_:
+                self._session._submit_async(
+                    "PUT",
+                    self.self,
+                    self._options.get("async_workers"),
+                    data=json_dumps(data),
                 )
-            else:
-                r = self._session.put(self.self, data=json.dumps(data))
+            elif retry:
+                r = self._session.put(self.self, data=json_dumps(data))
 
-        time.sleep(self._options["delay_reload"])
-        self._load(self.self)
+        if reload:
+            time.sleep(self._options["delay_reload"])
+            self._load(self.self)
 
     def delete(self, params: dict[str, Any] | None = None) -> Response | None:
         """Delete this resource from the server, passing the specified query parameters.
@@ -420,11 +495,8 @@ class Resource:
             Optional[Response]: Returns None if async
         """
         if self._options["async"]:
-            # FIXME: mypy doesn't think this should work
-            if not hasattr(self._session, "_async_jobs"):
-                self._session._async_jobs = set()  # type: ignore
-            self._session._async_jobs.add(  # type: ignore
-                threaded_requests.delete(url=self.self, params=params)  # type: ignore
+            self._session._submit_async(
+                "DELETE", self.self, self._options.get("async_workers"), params=params
             )
             return None
         else:
@@ -433,7 +505,7 @@ class Resource:
     def _load(
         self,
         url: str,
-        headers=CaseInsensitiveDict(),
+        headers: dict[str, str] | None = None,
         params: dict[str, str] | None = None,
         path: str | None = None,
     ):
@@ -441,13 +513,15 @@ class Resource:
 
         Args:
             url (str): url
-            headers (Optional[CaseInsensitiveDict]): headers. Defaults to CaseInsensitiveDict().
+            headers (Optional[Dict[str,str]]): headers. Defaults to None.
             params (Optional[Dict[str,str]]): params to get request. Defaults to None.
             path (Optional[str]): field to get. Defaults to None.
 
         Raises:
             ValueError: If json cannot be loaded
         """
+        if headers is None:
+            headers = {}
         r = self._session.get(url, headers=headers, params=params)
         try:
             j = json_loads(r)
@@ -468,17 +542,23 @@ class Resource:
         if not raw:
             raise NotImplementedError(f"We cannot instantiate empty resources: {raw}")
         dict2resource(raw, self, self._options, self._session)
+        self._cache_hash()
 
     def _default_headers(self, user_headers):
-        # result = dict(user_headers)
-        # result['accept'] = 'application/json'
-        return CaseInsensitiveDict(
-            self._options["headers"].items() + user_headers.items()
-        )
+        headers = CaseInsensitiveDict(self._options["headers"])
+        headers.update(user_headers)
+        return headers
 
 
-class Attachment(Resource):
-    """An issue attachment."""
+class _PathResource(Resource):
+    """A resource whose path and base url are the same for every instance of its class.
+
+    Subclasses only need to set ``_RESOURCE_PATH`` (and ``_RESOURCE_BASE_URL`` if it isn't
+    the Jira REST API) instead of passing them to ``Resource.__init__()``.
+    """
+
+    _RESOURCE_PATH: str
+    _RESOURCE_BASE_URL: str = Resource.JIRA_BASE_URL
 
     def __init__(
         self,
@@ -486,10 +566,15 @@ class Attachment(Resource):
         session: ResilientSession,
         raw: dict[str, Any] = None,
     ):
-        Resource.__init__(self, "attachment/{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+        Resource.__init__(
+            self, self._RESOURCE_PATH, options, session, self._RESOURCE_BASE_URL, raw
+        )
+
+
+class Attachment(_PathResource):
+    """An issue attachment."""
+
+    _RESOURCE_PATH = "attachment/{0}"
 
     def get(self):
         """Return the file content as a string."""
@@ -502,19 +587,10 @@ class Attachment(Resource):
         return r.iter_content(chunk_size)
 
 
-class Component(Resource):
+class Component(_PathResource):
     """A project component."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "component/{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "component/{0}"
 
     def delete(self, moveIssuesTo: str | None = None):  # type: ignore[override]
         """Delete this component from the server.
@@ -529,67 +605,37 @@ class Component(Resource):
         super().delete(params)
 
 
-class CustomFieldOption(Resource):
+class CustomFieldOption(_PathResource):
     """An existing option for a custom issue field."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "customFieldOption/{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "customFieldOption/{0}"
 
 
-class Dashboard(Resource):
+class Dashboard(_PathResource):
     """A Jira dashboard."""
 
+    _RESOURCE_PATH = "dashboard/{0}"
+
     def __init__(
         self,
         options: dict[str, str],
         session: ResilientSession,
         raw: dict[str, Any] = None,
     ):
-        Resource.__init__(self, "dashboard/{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
+        super().__init__(options, session, raw)
         self.gadgets: list[DashboardGadget] = []
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
 
 
-class DashboardItemPropertyKey(Resource):
+class DashboardItemPropertyKey(_PathResource):
     """A jira dashboard item property key."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "dashboard/{0}/items/{1}/properties", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "dashboard/{0}/items/{1}/properties"
 
 
-class DashboardItemProperty(Resource):
+class DashboardItemProperty(_PathResource):
     """A jira dashboard item."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(
-            self, "dashboard/{0}/items/{1}/properties/{2}", options, session
-        )
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "dashboard/{0}/items/{1}/properties/{2}"
 
     def update(  # type: ignore[override] # incompatible supertype ignored
         self, dashboard_id: str, item_id: str, value: dict[str, Any]
@@ -607,12 +653,11 @@ class DashboardItemProperty(Resource):
         Returns:
           DashboardItemProperty
         """
-        options = self._options.copy()
-        options["path"] = (
+        url = self._get_url(
             f"dashboard/{dashboard_id}/items/{item_id}/properties/{self.key}"
         )
         self.raw["value"].update(value)
-        self._session.put(self.JIRA_BASE_URL.format(**options), self.raw["value"])
+        self._session.put(url, self.raw["value"])
 
         return DashboardItemProperty(self._options, self._session, raw=self.raw)
 
@@ -627,28 +672,26 @@ class DashboardItemProperty(Resource):
         Returns:
           Response
         """
-        options = self._options.copy()
-        options["path"] = (
+        url = self._get_url(
             f"dashboard/{dashboard_id}/items/{item_id}/properties/{self.key}"
         )
 
-        return self._session.delete(self.JIRA_BASE_URL.format(**options))
+        return self._session.delete(url)
 
 
-class DashboardGadget(Resource):
+class DashboardGadget(_PathResource):
     """A jira dashboard gadget."""
 
+    _RESOURCE_PATH = "dashboard/{0}/gadget/{1}"
+
     def __init__(
         self,
         options: dict[str, str],
         session: ResilientSession,
         raw: dict[str, Any] = None,
     ):
-        Resource.__init__(self, "dashboard/{0}/gadget/{1}", options, session)
-        if raw:
-            self._parse_raw(raw)
+        super().__init__(options, session, raw)
         self.item_properties: list[DashboardItemProperty] = []
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
 
     def update(  # type: ignore[override] # incompatible supertype ignored
         self,
@@ -676,19 +719,26 @@ class DashboardGadget(Resource):
         Returns:
           ``DashboardGadget``
         """
-        data = remove_empty_attributes(
-            {"color": color, "position": position, "title": title}
-        )
-        options = self._options.copy()
-        options["path"] = f"dashboard/{dashboard_id}/gadget/{self.id}"
+        data = {
+            key: value
+            for key, value in (
+                ("color", color),
+                ("position", position),
+                ("title", title),
+            )
+            if value is not None
+        }
+        url = self._get_url(f"dashboard/{dashboard_id}/gadget/{self.id}")
 
-        self._session.put(self.JIRA_BASE_URL.format(**options), json=data)
-        options["path"] = f"dashboard/{dashboard_id}/gadget"
+        r = self._session.put(url, json=data)
+        if r.content:
+            # Use the updated gadget if it is returned, instead of fetching them all
+            return DashboardGadget(self._options, self._session, raw=json_loads(r))
 
         return next(
             DashboardGadget(self._options, self._session, raw=gadget)
             for gadget in self._session.get(
-                self.JIRA_BASE_URL.format(**options)
+                self._get_url(f"dashboard/{dashboard_id}/gadget")
             ).json()["gadgets"]
             if gadget["id"] == self.id
         )
@@ -702,46 +752,27 @@ class DashboardGadget(Resource):
         Returns:
           Response
         """
-        options = self._options.copy()
-        options["path"] = f"dashboard/{dashboard_id}/gadget/{self.id}"
+        url = self._get_url(f"dashboard/{dashboard_id}/gadget/{self.id}")
 
-        return self._session.delete(self.JIRA_BASE_URL.format(**options))
+        return self._session.delete(url)
 
 
-class Field(Resource):
+class Field(_PathResource):
     """An issue field.
 
     A field cannot be fetched from the Jira API individually, but paginated lists of fields are returned by some endpoints.
     """
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "field/{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "field/{0}"
 
 
-class Filter(Resource):
+class Filter(_PathResource):
     """An issue navigator filter."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "filter/{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "filter/{0}"
 
 
-class Issue(Resource):
+class Issue(_PathResource):
     """A Jira issue."""
 
     class _IssueFields(AnyLike):
@@ -777,20 +808,11 @@ class Issue(Resource):
             self.watchers: Watchers
             self.worklog = self._Worklog()
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "issue/{0}", options, session)
+    _RESOURCE_PATH = "issue/{0}"
 
-        self.fields: Issue._IssueFields
-        self.id: str
-        self.key: str
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    fields: Issue._IssueFields
+    id: str
+    key: str
 
     def update(  # type: ignore[override] # incompatible supertype ignored
         self,
@@ -799,6 +821,7 @@ class Issue(Resource):
         async_: bool = None,
         jira: JIRA = None,
         notify: bool = True,
+        reload: bool = True,
         **fieldargs,
     ):
         """Update this issue on the server.
@@ -813,10 +836,13 @@ class Issue(Resource):
         Args:
             fields (Dict[str,Any]): a dict containing field names and the values to use
             update (Dict[str,Any]): a dict containing update the operations to apply
-            async_ (Optional[bool]): True to add the request to the queue, so it can be executed later using async_run() (Default: ``None``))
+            async_ (Optional[bool]): True to send the request in the background on the session's thread pool,
+              :py:meth:`jira.client.JIRA.async_do` waits for it to finish (Default: ``None``))
             jira (Optional[jira.client.JIRA]): JIRA instance.
             notify (bool): True to notify watchers about the update, sets parameter notifyUsers. (Default: ``True``).
               Admin or project admin permissions are required to disable the notification.
+            reload (bool): True to load the updated issue from the server afterwards. (Default: ``True``).
+              If False, ``raw`` and the fields are left as they were before the update.
             fieldargs (dict): keyword arguments will generally be merged into fields, except lists, which will be merged into updates
         """
         data = {}
@@ -830,26 +856,25 @@ class Issue(Resource):
         else:
             update_dict = {}
         data["update"] = update_dict
-        for field in sorted(fieldargs.keys()):
-            value = fieldargs[field]
+        for field, value in fieldargs.items():
             # apply some heuristics to make certain changes easier
             if isinstance(value, str):
                 if field == "assignee" or field == "reporter":
                     fields_dict[field] = {"name": value}
                 elif field == "comment":
-                    if "comment" not in update_dict:
-                        update_dict["comment"] = []
-                    update_dict["comment"].append({"add": {"body": value}})
+                    update_dict.setdefault("comment", []).append(
+                        {"add": {"body": value}}
+                    )
                 else:
                     fields_dict[field] = value
             elif isinstance(value, list):
-                if field not in update_dict:
-                    update_dict[field] = []
-                update_dict[field].extend(value)
+                update_dict.setdefault(field, []).extend(value)
             else:
                 fields_dict[field] = value
 
-        super().update(async_=async_, jira=jira, notify=notify, fields=data)
+        super().update(
+            async_=async_, jira=jira, notify=notify, reload=reload, fields=data
+        )
 
     def get_field(self, field_name: str) -> Any:
         """Obtain the (parsed) value from the Issue's field.
@@ -899,19 +924,10 @@ class Issue(Resource):
         return f"{self._options['server']}/browse/{self.key}"
 
 
-class Comment(Resource):
+class Comment(_PathResource):
     """An issue comment."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "issue/{0}/comment/{1}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "issue/{0}/comment/{1}"
 
     def update(  # type: ignore[override]
         # The above ignore is added because we've added new parameters and order of
@@ -932,7 +948,8 @@ class Comment(Resource):
 
         Args:
             fields (Optional[Dict[str, Any]]): DEPRECATED => a comment doesn't have fields
-            async_ (Optional[bool]): True to add the request to the queue, so it can be executed later using async_run() (Default: ``None``))
+            async_ (Optional[bool]): True to send the request in the background on the session's thread pool,
+              :py:meth:`jira.client.JIRA.async_do` waits for it to finish (Default: ``None``))
             jira (jira.client.JIRA): Instance of Jira Client
             visibility (Optional[Dict[str, str]]): a dict containing two entries: "type" and "value".
               "type" is 'role' (or 'group' if the Jira server has configured comment visibility for groups)
@@ -955,19 +972,10 @@ class Comment(Resource):
         super().update(async_=async_, jira=jira, notify=notify, fields=data)
 
 
-class RemoteLink(Resource):
+class RemoteLink(_PathResource):
     """A link to a remote application from an issue."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "issue/{0}/remotelink/{1}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "issue/{0}/remotelink/{1}"
 
     def update(self, object, globalId=None, application=None, relationship=None):
         """Update a RemoteLink. 'object' is required.
@@ -992,137 +1000,75 @@ class RemoteLink(Resource):
         super().update(**data)
 
 
-class Votes(Resource):
+class Votes(_PathResource):
     """Vote information on an issue."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "issue/{0}/votes", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "issue/{0}/votes"
 
 
-class IssueTypeScheme(Resource):
+class IssueTypeScheme(_PathResource):
     """An issue type scheme."""
 
-    def __init__(self, options, session, raw=None):
-        Resource.__init__(self, "issuetypescheme", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "issuetypescheme"
 
 
-class IssueSecurityLevelScheme(Resource):
+class IssueSecurityLevelScheme(_PathResource):
     """IssueSecurityLevelScheme information on a project."""
 
-    def __init__(self, options, session, raw=None):
-        Resource.__init__(
-            self, "project/{0}/issuesecuritylevelscheme?expand=user", options, session
-        )
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "project/{0}/issuesecuritylevelscheme?expand=user"
 
 
-class NotificationScheme(Resource):
+class NotificationScheme(_PathResource):
     """NotificationScheme information on a project."""
 
-    def __init__(self, options, session, raw=None):
-        Resource.__init__(
-            self, "project/{0}/notificationscheme?expand=user", options, session
-        )
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "project/{0}/notificationscheme?expand=user"
 
 
-class PermissionScheme(Resource):
+class PermissionScheme(_PathResource):
     """Permissionscheme information on a project."""
 
-    def __init__(self, options, session, raw=None):
-        Resource.__init__(
-            self, "project/{0}/permissionscheme?expand=user", options, session
-        )
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "project/{0}/permissionscheme?expand=user"
 
 
-class PriorityScheme(Resource):
+class PriorityScheme(_PathResource):
     """PriorityScheme information on a project."""
 
-    def __init__(self, options, session, raw=None):
-        Resource.__init__(
-            self, "project/{0}/priorityscheme?expand=user", options, session
-        )
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "project/{0}/priorityscheme?expand=user"
 
 
-class WorkflowScheme(Resource):
+class WorkflowScheme(_PathResource):
     """WorkflowScheme information on a project."""
 
-    def __init__(self, options, session, raw=None):
-        Resource.__init__(
-            self, "project/{0}/workflowscheme?expand=user", options, session
-        )
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "project/{0}/workflowscheme?expand=user"
 
 
-class Watchers(Resource):
+class Watchers(_PathResource):
     """Watcher information on an issue."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "issue/{0}/watchers", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "issue/{0}/watchers"
 
     def delete(self, username):
         """Remove the specified user from the watchers list."""
         super().delete(params={"username": username})
 
 
-class TimeTracking(Resource):
+class TimeTracking(_PathResource):
+    _RESOURCE_PATH = "issue/{0}/worklog/{1}"
+
     def __init__(
         self,
         options: dict[str, str],
         session: ResilientSession,
         raw: dict[str, Any] = None,
     ):
-        Resource.__init__(self, "issue/{0}/worklog/{1}", options, session)
         self.remainingEstimate = None
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+        super().__init__(options, session, raw)
 
 
-class Worklog(Resource):
+class Worklog(_PathResource):
     """Worklog on an issue."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "issue/{0}/worklog/{1}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "issue/{0}/worklog/{1}"
 
     def delete(  # type: ignore[override]
         self, adjustEstimate: str | None = None, newEstimate=None, increaseBy=None
@@ -1147,19 +1093,10 @@ class Worklog(Resource):
         super().delete(params)
 
 
-class IssueProperty(Resource):
+class IssueProperty(_PathResource):
     """Custom data against an issue."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "issue/{0}/properties/{1}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "issue/{0}/properties/{1}"
 
     def _find_by_url(
         self,
@@ -1169,96 +1106,43 @@ class IssueProperty(Resource):
         super()._find_by_url(url, params)
         # An IssueProperty never returns "self" identifier, set it
         self.self = url
+        self._cache_hash()
 
 
-class IssueLink(Resource):
+class IssueLink(_PathResource):
     """Link between two issues."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "issueLink/{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "issueLink/{0}"
 
 
-class IssueLinkType(Resource):
+class IssueLinkType(_PathResource):
     """Type of link between two issues."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "issueLinkType/{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "issueLinkType/{0}"
 
 
-class IssueType(Resource):
+class IssueType(_PathResource):
     """Type of issue."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "issuetype/{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "issuetype/{0}"
 
 
-class Priority(Resource):
+class Priority(_PathResource):
     """Priority that can be set on an issue."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "priority/{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "priority/{0}"
 
 
-class Project(Resource):
+class Project(_PathResource):
     """A Jira project."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "project/{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "project/{0}"
 
 
-class Role(Resource):
+class Role(_PathResource):
     """A role inside a project."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "project/{0}/role/{1}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "project/{0}/role/{1}"
 
     def update(  # type: ignore[override]
         self,
@@ -1303,67 +1187,31 @@ class Role(Resource):
             groups = (groups,)
 
         data = {"user": users, "group": groups}
-        self._session.post(self.self, data=json.dumps(data))
+        self._session.post(self.self, data=json_dumps(data))
 
 
-class Resolution(Resource):
+class Resolution(_PathResource):
     """A resolution for an issue."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "resolution/{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "resolution/{0}"
 
 
-class SecurityLevel(Resource):
+class SecurityLevel(_PathResource):
     """A security level for an issue or project."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "securitylevel/{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "securitylevel/{0}"
 
 
-class Status(Resource):
+class Status(_PathResource):
     """Status for an issue."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "status/{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "status/{0}"
 
 
-class StatusCategory(Resource):
+class StatusCategory(_PathResource):
     """StatusCategory for an issue."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "statuscategory/{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "statuscategory/{0}"
 
 
 class User(Resource):
@@ -1381,40 +1229,21 @@ class User(Resource):
         if raw and "accountId" in raw["self"]:
             _query_param = "accountId"
 
-        Resource.__init__(self, f"user?{_query_param}" + "={0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+        Resource.__init__(
+            self, f"user?{_query_param}" + "={0}", options, session, raw=raw
+        )
 
 
-class Group(Resource):
+class Group(_PathResource):
     """A Jira user group."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "group?groupname={0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "group?groupname={0}"
 
 
-class Version(Resource):
+class Version(_PathResource):
     """A version of a project."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "version/{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "version/{0}"
 
     def delete(self, moveFixIssuesTo=None, moveAffectedIssuesTo=None):
         """Delete this project version from the server.
@@ -1455,11 +1284,7 @@ class Version(Resource):
                 >> print(version.archived)
                 True
         """
-        data = {}
-        for field in kwargs:
-            data[field] = kwargs[field]
-
-        super().update(**data)
+        super().update(**kwargs)
 
 
 # Agile
@@ -1482,10 +1307,7 @@ class AgileResource(Resource):
     ):
         self.self = None
 
-        Resource.__init__(self, path, options, session, self.AGILE_BASE_URL)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+        Resource.__init__(self, path, options, session, self.AGILE_BASE_URL, raw)
 
 
 class Sprint(AgileResource):
@@ -1515,69 +1337,33 @@ class Board(AgileResource):
 # Service Desk
 
 
-class Customer(Resource):
+class Customer(_PathResource):
     """A Service Desk customer."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(
-            self, "customer", options, session, "{server}/rest/servicedeskapi/{path}"
-        )
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "customer"
+    _RESOURCE_BASE_URL = "{server}/rest/servicedeskapi/{path}"
 
 
-class ServiceDesk(Resource):
+class ServiceDesk(_PathResource):
     """A Service Desk."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(
-            self,
-            "servicedesk/{0}",
-            options,
-            session,
-            "{server}/rest/servicedeskapi/{path}",
-        )
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "servicedesk/{0}"
+    _RESOURCE_BASE_URL = "{server}/rest/servicedeskapi/{path}"
 
 
-class RequestType(Resource):
+class RequestType(_PathResource):
     """A Service Desk Request Type."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(
-            self,
-            "servicedesk/{0}/requesttype",
-            options,
-            session,
-            "{server}/rest/servicedeskapi/{path}",
-        )
-
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "servicedesk/{0}/requesttype"
+    _RESOURCE_BASE_URL = "{server}/rest/servicedeskapi/{path}"
 
 
 # Utilities
 
 
+_SEQUENCE_TYPES = (tuple, list, set, frozenset)
+
+
 def dict2resource(
     raw: dict[str, Any], top=None, options=None, session=None
 ) -> PropertyHolder | type[Resource]:
@@ -1589,120 +1375,245 @@ def dict2resource(
     if top is None:
         top = PropertyHolder()
 
-    seqs = tuple, list, set, frozenset
-    for i, j in raw.items():
-        if isinstance(j, dict):
-            if "self" in j:
-                # to try and help mypy know that cls_for_resource can never be 'Resource'
-                resource_class = cast(Type[Resource], cls_for_resource(j["self"]))
-                resource = cast(
-                    Type[Resource],
-                    resource_class(  # type: ignore
-                        options=options,
-                        session=session,
-                        raw=j,  # type: ignore
-                    ),
-                )
-                setattr(top, i, resource)
-            elif i == "timetracking":
-                setattr(top, "timetracking", TimeTracking(options, session, j))
-            else:
-                setattr(top, i, dict2resource(j, options=options, session=session))
-        elif isinstance(j, seqs):
-            j = cast(List[Dict[str, Any]], j)  # help mypy
-            seq_list: list[Any] = []
-            for seq_elem in j:
-                if isinstance(seq_elem, dict):
-                    if "self" in seq_elem:
-                        # to try and help mypy know that cls_for_resource can never be 'Resource'
-                        resource_class = cast(
-                            Type[Resource], cls_for_resource(seq_elem["self"])
-                        )
-                        resource = cast(
-                            Type[Resource],
-                            resource_class(  # type: ignore
-                                options=options,
-                                session=session,
-                                raw=seq_elem,  # type: ignore
-                            ),
-                        )
-                        seq_list.append(resource)
-                    else:
-                        seq_list.append(
-                            dict2resource(seq_elem, options=options, session=session)
-                        )
+    intern = sys.intern
+    # Nested dicts without a ``self`` link are walked with a stack of
+    # (holder, dict) pairs rather than by recursing
+    stack: list[tuple[PropertyHolder | Resource, dict[str, Any]]] = [(top, raw)]
+
+    def _materialize(value: dict[str, Any]) -> PropertyHolder | Resource:
+        if "self" in value:
+            # cls_for_resource never returns Resource itself, only subclasses
+            # without the path argument
+            return cls_for_resource(value["self"])(  # type: ignore[call-arg]
+                options=options, session=session, raw=value
+            )
+        child = PropertyHolder()
+        stack.append((child, value))
+        return child
+
+    while stack:
+        holder, mapping = stack.pop()
+        for i, j in mapping.items():
+            # The same field names come back in every issue, interned names
+            # share one string and are looked up by identity
+            i = intern(i)
+            if isinstance(j, dict):
+                if i == "timetracking" and "self" not in j:
+                    setattr(holder, "timetracking", TimeTracking(options, session, j))
                 else:
-                    seq_list.append(seq_elem)
-            setattr(top, i, seq_list)
-        else:
-            setattr(top, i, j)
+                    setattr(holder, i, _materialize(j))
+            elif isinstance(j, _SEQUENCE_TYPES):
+                seq_list = [_materialize(e) if isinstance(e, dict) else e for e in j]
+                setattr(holder, i, seq_list)
+            else:
+                setattr(holder, i, j)
     return top
 
 
-resource_class_map: dict[str, type[Resource]] = {
-    # Jira-specific resources
-    r"attachment/[^/]+$": Attachment,
-    r"component/[^/]+$": Component,
-    r"customFieldOption/[^/]+$": CustomFieldOption,
-    r"dashboard/[^/]+$": Dashboard,
-    r"dashboard/[^/]+/items/[^/]+/properties+$": DashboardItemPropertyKey,
-    r"dashboard/[^/]+/items/[^/]+/properties/[^/]+$": DashboardItemProperty,
-    r"dashboard/[^/]+/gadget/[^/]+$": DashboardGadget,
-    r"filter/[^/]$": Filter,
-    r"issue/[^/]+$": Issue,
-    r"issue/[^/]+/comment/[^/]+$": Comment,
-    r"issue/[^/]+/votes$": Votes,
-    r"issue/[^/]+/watchers$": Watchers,
-    r"issue/[^/]+/worklog/[^/]+$": Worklog,
-    r"issue/[^/]+/properties/[^/]+$": IssueProperty,
-    r"issueLink/[^/]+$": IssueLink,
-    r"issueLinkType/[^/]+$": IssueLinkType,
-    r"issuetype/[^/]+$": IssueType,
-    r"issuetypescheme/[^/]+$": IssueTypeScheme,
-    r"project/[^/]+/issuesecuritylevelscheme[^/]+$": IssueSecurityLevelScheme,
-    r"project/[^/]+/notificationscheme[^/]+$": NotificationScheme,
-    r"project/[^/]+/priorityscheme[^/]+$": PriorityScheme,
-    r"priority/[^/]+$": Priority,
-    r"project/[^/]+$": Project,
-    r"project/[^/]+/role/[^/]+$": Role,
-    r"project/[^/]+/permissionscheme[^/]+$": PermissionScheme,
-    r"project/[^/]+/workflowscheme[^/]+$": WorkflowScheme,
-    r"resolution/[^/]+$": Resolution,
-    r"securitylevel/[^/]+$": SecurityLevel,
-    r"status/[^/]+$": Status,
-    r"statuscategory/[^/]+$": StatusCategory,
-    r"user\?(username|key|accountId).+$": User,
-    r"group\?groupname.+$": Group,
-    r"version/[^/]+$": Version,
-    # Agile specific resources
-    r"sprints/[^/]+$": Sprint,
-    r"views/[^/]+$": Board,
-}
-
-
-class UnknownResource(Resource):
+def _refresh_resource_classes(method):
+    """Wrap a dict method so that changing the map refreshes the lookup tables."""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        _compile_resource_classes()
+        return result
+
+    return wrapper
+
+
+class _ResourceClassMap(dict):
+    """The ``resource_class_map`` dict.
+
+    ``cls_for_resource()`` works on compiled and indexed copies of the patterns, this
+    rebuilds them (and clears its cache) whenever a class is registered or removed.
+    """
+
+    __setitem__ = _refresh_resource_classes(dict.__setitem__)
+    __delitem__ = _refresh_resource_classes(dict.__delitem__)
+    __ior__ = _refresh_resource_classes(dict.__ior__)
+    clear = _refresh_resource_classes(dict.clear)
+    pop = _refresh_resource_classes(dict.pop)
+    popitem = _refresh_resource_classes(dict.popitem)
+    setdefault = _refresh_resource_classes(dict.setdefault)
+    update = _refresh_resource_classes(dict.update)
+
+
+# Changes to this map at runtime are picked up by cls_for_resource(), e.g. to
+# register a custom Resource subclass for a url. Changing it in place is the
+# cheapest, a plain dict rebound to this name is compared item by item on every
+# lookup instead.
+resource_class_map: dict[str, type[Resource]] = _ResourceClassMap(
+    {
+        # Jira-specific resources
+        r"attachment/[^/]+$": Attachment,
+        r"component/[^/]+$": Component,
+        r"customFieldOption/[^/]+$": CustomFieldOption,
+        r"dashboard/[^/]+$": Dashboard,
+        r"dashboard/[^/]+/items/[^/]+/properties+$": DashboardItemPropertyKey,
+        r"dashboard/[^/]+/items/[^/]+/properties/[^/]+$": DashboardItemProperty,
+        r"dashboard/[^/]+/gadget/[^/]+$": DashboardGadget,
+        r"filter/[^/]$": Filter,
+        r"issue/[^/]+$": Issue,
+        r"issue/[^/]+/comment/[^/]+$": Comment,
+        r"issue/[^/]+/votes$": Votes,
+        r"issue/[^/]+/watchers$": Watchers,
+        r"issue/[^/]+/worklog/[^/]+$": Worklog,
+        r"issue/[^/]+/properties/[^/]+$": IssueProperty,
+        r"issueLink/[^/]+$": IssueLink,
+        r"issueLinkType/[^/]+$": IssueLinkType,
+        r"issuetype/[^/]+$": IssueType,
+        r"issuetypescheme/[^/]+$": IssueTypeScheme,
+        r"project/[^/]+/issuesecuritylevelscheme[^/]+$": IssueSecurityLevelScheme,
+        r"project/[^/]+/notificationscheme[^/]+$": NotificationScheme,
+        r"project/[^/]+/priorityscheme[^/]+$": PriorityScheme,
+        r"priority/[^/]+$": Priority,
+        r"project/[^/]+$": Project,
+        r"project/[^/]+/role/[^/]+$": Role,
+        r"project/[^/]+/permissionscheme[^/]+$": PermissionScheme,
+        r"project/[^/]+/workflowscheme[^/]+$": WorkflowScheme,
+        r"resolution/[^/]+$": Resolution,
+        r"securitylevel/[^/]+$": SecurityLevel,
+        r"status/[^/]+$": Status,
+        r"statuscategory/[^/]+$": StatusCategory,
+        r"user\?(username|key|accountId).+$": User,
+        r"group\?groupname.+$": Group,
+        r"version/[^/]+$": Version,
+        # Agile specific resources
+        r"sprints/[^/]+$": Sprint,
+        r"views/[^/]+$": Board,
+    }
+)
+
+
+class UnknownResource(_PathResource):
     """A Resource from Jira that is not (yet) supported."""
 
-    def __init__(
-        self,
-        options: dict[str, str],
-        session: ResilientSession,
-        raw: dict[str, Any] = None,
-    ):
-        Resource.__init__(self, "unknown{0}", options, session)
-        if raw:
-            self._parse_raw(raw)
-        self.raw: dict[str, Any] = cast(Dict[str, Any], self.raw)
+    _RESOURCE_PATH = "unknown{0}"
+
+
+# A pattern starting with a literal word followed by '/' or '?' can only match
+# where that word ends a segment of the url
+_LEADING_WORD_RE = re.compile(r"(\w+)(?:/|\\\?)")
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    """Whether a ``|`` outside of any group lets the pattern match without its first word.
+
+    Args:
+        pattern (str): The regular expression.
+
+    Returns:
+        bool
+    """
+    depth = 0
+    escaped = in_class = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and not depth:
+            return True
+    return False
+
+
+def _compile_resource_classes():
+    """Compile and index the patterns of ``resource_class_map`` for ``cls_for_resource()``.
+
+    The patterns are grouped by the word they start with, so that only those whose
+    word is in the url need to be tried. Patterns that don't start with a literal
+    word are tried for every url.
+    """
+    global _RESOURCE_CLASS_TABLES
+
+    source = resource_class_map
+    # Only a _ResourceClassMap tells when it changes, other dicts are compared
+    snapshot = None if isinstance(source, _ResourceClassMap) else tuple(source.items())
+    compiled = [(re.compile(p), cls) for p, cls in source.items()]
+    by_word: dict[str, list[int]] = {}
+    unindexed: list[int] = []
+    for position, (pattern, _) in enumerate(compiled):
+        match = _LEADING_WORD_RE.match(pattern.pattern)
+        if match and not _has_top_level_alternation(pattern.pattern):
+            by_word.setdefault(match[1], []).append(position)
+        else:
+            unindexed.append(position)
+    words = "|".join(map(re.escape, by_word)) or "(?!)"
+    words_re = re.compile(f"({words})(?=[/?])")
+
+    # Swapped as a whole so that a concurrent lookup never mixes old and new tables
+    _RESOURCE_CLASS_TABLES = (source, snapshot, compiled, by_word, unindexed, words_re)
+    _cls_for_resource.cache_clear()
+
+
+_RESOURCE_CLASS_TABLES: tuple[
+    dict[str, type[Resource]],
+    tuple[tuple[str, type[Resource]], ...] | None,
+    list[tuple[re.Pattern[str], type[Resource]]],
+    dict[str, list[int]],
+    list[int],
+    re.Pattern[str],
+]
 
 
 def cls_for_resource(resource_literal: str) -> type[Resource]:
-    for resource in resource_class_map:
-        if re.search(resource, resource_literal):
-            return resource_class_map[resource]
-    else:
-        # Generic Resource cannot directly be used b/c of different constructor signature
-        return UnknownResource
+    source, snapshot = _RESOURCE_CLASS_TABLES[:2]
+    if resource_class_map is not source or (
+        snapshot is not None and snapshot != tuple(source.items())
+    ):
+        # resource_class_map was rebound, or is a plain dict that was changed
+        _compile_resource_classes()
+    return _cls_for_resource(resource_literal)
+
+
+# The same self urls (statuses, priorities, issue types, users...) come back
+# in most of the issues of a search
+@lru_cache(maxsize=4096)
+def _cls_for_resource(resource_literal: str) -> type[Resource]:
+    _, _, compiled, by_word, unindexed, words_re = _RESOURCE_CLASS_TABLES
+    # Only try the patterns whose first word is in the url, in the order of
+    # resource_class_map
+    positions = sorted(
+        [
+            *unindexed,
+            *(
+                position
+                for word in set(words_re.findall(resource_literal))
+                for position in by_word[word]
+            ),
+        ]
+    )
+    for position in positions:
+        pattern, cls = compiled[position]
+        if pattern.search(resource_literal):
+            return cls
+    # Generic Resource cannot directly be used b/c of different constructor signature
+    return UnknownResource
+
+
+_compile_resource_classes()
 
 
 class PropertyHolder:
     """An object for storing named attributes."""
+
+    # dict2resource creates one per nested object without a self link, they
+    # are never weakly referenced
+    __slots__ = ("__dict__",)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickling the holder, pickle protocols 0 and 1 require this once __slots__ is set."""
+        return vars(self)
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Unpickling of the holder."""
+        vars(self).update(state)
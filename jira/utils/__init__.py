@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import codecs
+import json
 import threading
 import warnings
 from typing import Any, cast
@@ -11,6 +13,11 @@ from requests.structures import CaseInsensitiveDict as _CaseInsensitiveDict
 
 from jira.resilientsession import raise_on_error
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 class CaseInsensitiveDict(_CaseInsensitiveDict):
     """A case-insensitive ``dict``-like object.
@@ -62,6 +69,14 @@ def threaded_requests(requests):
 def json_loads(resp: Response | None) -> Any:
     """Attempts to load json the result of a response.
 
+    ``orjson`` is used when it is installed and the body is UTF-8. Bodies in another
+    declared charset, bodies ``orjson`` rejects and responses that are not backed by
+    bytes (e.g. mocks) are decoded by :py:meth:`requests.Response.json` instead.
+
+    Note:
+        ``orjson`` only keeps integers that fit in 64 bits exact, larger ones come
+        back as floats. Jira ids and counts are well within that range.
+
     Args:
         resp (Optional[Response]): The Response object
 
@@ -74,6 +89,17 @@ def json_loads(resp: Response | None) -> Any:
     raise_on_error(resp)  # if 'resp' is None, will raise an error here
     resp = cast(Response, resp)  # tell mypy only Response-like are here
     try:
+        if (
+            orjson is not None
+            and isinstance(resp.content, bytes)
+            and _is_utf8(resp.encoding)
+        ):
+            try:
+                # parse the bytes directly, without decoding the body to a str first
+                return orjson.loads(resp.content)
+            except orjson.JSONDecodeError:
+                # e.g. an UTF-16 body without a charset, let requests guess it
+                pass
         return resp.json()
     except ValueError:
         # json.loads() fails with empty bodies
@@ -82,6 +108,41 @@ def json_loads(resp: Response | None) -> Any:
         raise
 
 
+def _is_utf8(encoding: Any) -> bool:
+    """Whether a response with this encoding can be handed to ``orjson`` as is.
+
+    Args:
+        encoding (Any): The encoding of the response, ``None`` if not declared.
+
+    Returns:
+        bool
+    """
+    if encoding is None:
+        return True
+    if not isinstance(encoding, str):
+        return False
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize data to be sent as a JSON request body.
+
+    Uses ``orjson`` when it is installed, as it is considerably faster than :py:func:`json.dumps` for large payloads.
+
+    Args:
+        data (Any): The data to serialize.
+
+    Returns:
+        bytes: the UTF-8 encoded json
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode("utf-8")
+
+
 def remove_empty_attributes(data: dict[str, Any]) -> dict[str, Any]:
     """A convenience function to remove key/value pairs with `None` for a value.
 
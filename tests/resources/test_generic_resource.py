@@ -1,16 +1,39 @@
 from __future__ import annotations
 
+import copy
+import json
+import pickle
+from unittest.mock import Mock, patch
+
 import pytest
+from requests import Response
 
 import jira.resources
 
 MOCK_URL = "http://customized-jira.com/rest/"
 
 
+OPTIONS = {
+    "server": "http://customized-jira.com",
+    "rest_path": "api",
+    "rest_api_version": "2",
+}
+
+
+UPDATE_OPTIONS = {**OPTIONS, "async": False, "delay_reload": 0, "headers": {}}
+
+
 def url_test_case(example_url: str):
     return f"{MOCK_URL}{example_url}"
 
 
+def mock_response(body=None, status_code: int = 200) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = b"" if body is None else json.dumps(body).encode()
+    return response
+
+
 class TestResource:
     # fmt: off
     @pytest.mark.parametrize(
@@ -46,3 +69,325 @@ class TestResource:
     def test_cls_for_resource(self, example_url, expected_class):
         """Test the regex recognizes the right class for a given URL."""
         assert jira.resources.cls_for_resource(example_url) == expected_class
+
+    def test_get_url(self):
+        """Test the resource url is built from the options and the path."""
+        options = {
+            "server": "http://customized-jira.com",
+            "rest_path": "api",
+            "rest_api_version": "2",
+        }
+        resource = jira.resources.Resource("issue/{0}", options, None)
+        assert resource._get_url("issue/1") == f"{MOCK_URL}api/2/issue/1"
+        assert resource._get_url("issue/2") == f"{MOCK_URL}api/2/issue/2"
+
+    def test_str_and_repr(self):
+        """Test the readable identifiers are used in the string representations."""
+        raw = {
+            "self": url_test_case("api/latest/customFieldOption/1"),
+            "value": "parent",
+            "id": "1",
+            "child": {
+                "self": url_test_case("api/latest/customFieldOption/2"),
+                "value": "child",
+                "id": "2",
+            },
+        }
+        option = jira.resources.CustomFieldOption({}, None, raw)
+        assert str(option) == "parent - child"
+        assert repr(option) == "<JIRA CustomFieldOption: value='parent', id='1'>"
+
+    def test_dict2resource_nested(self):
+        """Test nested dicts and lists of dicts become nested attributes."""
+        raw = {
+            "key": "value",
+            "a": {"b": {"c": 1}, "items": [{"d": 2}, 3]},
+            "status": {"self": url_test_case("api/latest/status/1"), "name": "Open"},
+        }
+        top = jira.resources.dict2resource(raw)
+        assert top.key == "value"
+        assert top.a.b.c == 1
+        assert top.a.items[0].d == 2
+        assert top.a.items[1] == 3
+        assert isinstance(top.status, jira.resources.Status)
+        assert top.status.name == "Open"
+
+    def test_dict2resource_deeply_nested(self):
+        """Test deeply nested dicts do not hit the recursion limit."""
+        raw: dict = {"leaf": True}
+        for _ in range(5000):
+            raw = {"nested": raw}
+        top = jira.resources.dict2resource(raw)
+        for _ in range(5000):
+            top = top.nested
+        assert top.leaf is True
+
+    def test_cached_hash(self):
+        """Test equal resources share a hash and differing ones do not."""
+        raw = {"self": url_test_case("user?username=bla"), "key": "bla"}
+        user = jira.resources.User({}, None, raw)
+        same = jira.resources.User({}, None, dict(raw))
+        other = jira.resources.User({}, None, {**raw, "key": "other"})
+        assert user == same
+        assert hash(user) == hash(same)
+        assert user != other
+        assert hash(user) != hash(other)
+
+    def test_eq_with_different_hash_ids(self):
+        """Test only the identifiers present on self are compared."""
+        raw = {"self": url_test_case("user?username=bla"), "key": "bla"}
+        user = jira.resources.User({}, None, raw)
+        named = jira.resources.User({}, None, {**raw, "name": "bla"})
+        assert hash(user) != hash(named)
+        assert user == named
+
+    def test_cached_hash_after_find_by_url(self):
+        """Test the hash is recomputed once _find_by_url() sets the self url."""
+        url = url_test_case("api/2/issue/1/properties/prop")
+        session = Mock()
+        session.get.return_value = mock_response({"key": "prop", "value": {}})
+
+        prop = jira.resources.IssueProperty({"headers": {}}, session)
+        prop._find_by_url(url)
+
+        expected = jira.resources.IssueProperty(
+            {}, None, {"self": url, "key": "prop", "value": {}}
+        )
+        assert prop.self == url
+        assert hash(prop) == hash(expected)
+
+    def test_cached_hash_after_unpickling(self):
+        """Test the hash is recomputed rather than taken from the pickled state."""
+        raw = {"self": url_test_case("user?username=bla"), "key": "bla"}
+        user = jira.resources.User({}, None, raw)
+        state = user.__getstate__()
+        state["_cached_hash"] = 1
+
+        restored = jira.resources.User.__new__(jira.resources.User)
+        restored.__setstate__(state)
+        assert hash(restored) == hash(user)
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_property_holder_pickle(self, protocol):
+        """Test nested property holders survive every pickle protocol."""
+        holder = jira.resources.dict2resource({"a": {"b": 1}, "c": [{"d": 2}]})
+        restored = pickle.loads(pickle.dumps(holder, protocol=protocol))
+        assert restored.a.b == 1
+        assert restored.c[0].d == 2
+
+    @staticmethod
+    def _issue_raw():
+        return {
+            "self": url_test_case("api/2/issue/10001"),
+            "id": "10001",
+            "key": "PRJ-1",
+            "fields": {
+                "summary": "A summary",
+                "status": {"self": url_test_case("api/2/status/1"), "name": "Open"},
+                "labels": ["a", "b"],
+            },
+        }
+
+    def _assert_issue_restored(self, restored, issue):
+        assert type(restored) is jira.resources.Issue
+        assert restored.raw == issue.raw
+        assert restored.key == "PRJ-1"
+        assert restored.fields.summary == "A summary"
+        assert restored.fields.status.name == "Open"
+        assert restored.fields.labels == ["a", "b"]
+        assert restored == issue
+        assert hash(restored) == hash(issue)
+        assert restored._get_url("issue/1") == issue._get_url("issue/1")
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_issue_pickle(self, protocol):
+        """Test a parsed issue survives a pickle round trip."""
+        issue = jira.resources.Issue(OPTIONS, None, self._issue_raw())
+        restored = pickle.loads(pickle.dumps(issue, protocol=protocol))
+        self._assert_issue_restored(restored, issue)
+
+    def test_issue_deepcopy(self):
+        """Test a parsed issue can be deep copied."""
+        issue = jira.resources.Issue(OPTIONS, None, self._issue_raw())
+        self._assert_issue_restored(copy.deepcopy(issue), issue)
+
+    def test_issue_unpickle_state_without_slots(self):
+        """Test a state pickled before the slots, with 'raw' in the plain dict, loads."""
+        issue = jira.resources.Issue(OPTIONS, None, self._issue_raw())
+        old_state = {
+            "_resource": "issue/{0}",
+            "_options": OPTIONS,
+            "_session": None,
+            "_base_url": jira.resources.Resource.JIRA_BASE_URL,
+            "raw": issue.raw,
+            **vars(jira.resources.dict2resource(issue.raw)),
+        }
+
+        restored = jira.resources.Issue.__new__(jira.resources.Issue)
+        restored.__setstate__(old_state)
+        self._assert_issue_restored(restored, issue)
+        assert "raw" not in vars(restored)
+
+    def test_cls_for_resource_registered_at_runtime(self):
+        """Test classes added to resource_class_map after import are looked up."""
+
+        class Custom(jira.resources.UnknownResource):
+            pass
+
+        url = url_test_case("api/latest/custom/1")
+        pattern = r"custom/[^/]+$"
+        assert jira.resources.cls_for_resource(url) == jira.resources.UnknownResource
+        jira.resources.resource_class_map[pattern] = Custom
+        try:
+            assert jira.resources.cls_for_resource(url) == Custom
+        finally:
+            del jira.resources.resource_class_map[pattern]
+        assert jira.resources.cls_for_resource(url) == jira.resources.UnknownResource
+
+    @pytest.mark.parametrize(
+        ["error", "expected_puts"],
+        [("Issues must be assigned.", 2), ("Something else went wrong.", 1)],
+        ids=["fixable", "unfixable"],
+    )
+    def test_update_autofix(self, error, expected_puts):
+        """Test the update is only sent again when autofix could fix an error."""
+        issue = jira.resources.Issue(
+            {**UPDATE_OPTIONS, "autofix": "admin"}, Mock(), self._issue_raw()
+        )
+        issue._session.put.side_effect = [
+            mock_response({"errorMessages": [error], "errors": {}}, 400),
+            mock_response(status_code=204),
+        ]
+
+        issue.update(summary="New summary", reload=False)
+
+        assert issue._session.put.call_count == expected_puts
+        if expected_puts == 2:
+            data = json.loads(issue._session.put.call_args.kwargs["data"])
+            assert data["fields"]["assignee"] == {"name": "admin"}
+            assert data["fields"]["summary"] == "New summary"
+
+    def _gadget(self, session):
+        return jira.resources.DashboardGadget(
+            UPDATE_OPTIONS,
+            session,
+            {"self": url_test_case("api/2/dashboard/1/gadget/5"), "id": 5},
+        )
+
+    def test_dashboard_gadget_update_from_response(self):
+        """Test the updated gadget is parsed from the PUT response when it has one."""
+        session = Mock()
+        session.put.return_value = mock_response({"id": 5, "title": "New title"})
+
+        gadget = self._gadget(session).update("1", title="New title")
+
+        session.put.assert_called_once_with(
+            f"{MOCK_URL}api/2/dashboard/1/gadget/5", json={"title": "New title"}
+        )
+        session.get.assert_not_called()
+        assert gadget.title == "New title"
+
+    def test_dashboard_gadget_update_without_response_body(self):
+        """Test the updated gadget is looked up in the dashboard without a PUT body."""
+        session = Mock()
+        session.put.return_value = mock_response(status_code=204)
+        session.get.return_value = mock_response(
+            {
+                "gadgets": [
+                    {"id": 4, "title": "Other"},
+                    {"id": 5, "title": "New title", "color": "blue"},
+                ]
+            }
+        )
+
+        gadget = self._gadget(session).update("1", color="blue", title="New title")
+
+        session.put.assert_called_once_with(
+            f"{MOCK_URL}api/2/dashboard/1/gadget/5",
+            json={"color": "blue", "title": "New title"},
+        )
+        session.get.assert_called_once_with(f"{MOCK_URL}api/2/dashboard/1/gadget")
+        assert gadget.id == 5
+        assert gadget.title == "New title"
+
+    def test_update_async_retry(self):
+        """Test an update fixed by autofix is sent again in the background when async."""
+        options = {**UPDATE_OPTIONS, "autofix": "admin", "async": True}
+        issue = jira.resources.Issue(options, Mock(), self._issue_raw())
+        issue._session.put.return_value = mock_response(
+            {"errorMessages": ["Issues must be assigned."], "errors": {}}, 400
+        )
+
+        issue.update(summary="New summary", reload=False)
+
+        issue._session.put.assert_called_once()
+        issue._session._submit_async.assert_called_once()
+        args, kwargs = issue._session._submit_async.call_args
+        assert args == ("PUT", issue.self, None)
+        assert json.loads(kwargs["data"])["fields"]["assignee"] == {"name": "admin"}
+
+    def test_async_delete(self):
+        """Test an async delete is submitted to the session's pool."""
+        options = {**UPDATE_OPTIONS, "async": True, "async_workers": 3}
+        raw = {"self": url_test_case("api/2/issue/10001/comment/1"), "id": "1"}
+        comment = jira.resources.Comment(options, Mock(), raw)
+
+        assert comment.delete(params={"notifyUsers": "false"}) is None
+
+        comment._session.delete.assert_not_called()
+        comment._session._submit_async.assert_called_once_with(
+            "DELETE", comment.self, 3, params={"notifyUsers": "false"}
+        )
+
+    @pytest.mark.parametrize("reload", [True, False])
+    def test_update_reload(self, reload):
+        """Test the resource is only fetched again after the update if reload is set."""
+        options = {**UPDATE_OPTIONS, "delay_reload": 0.5}
+        issue = jira.resources.Issue(options, Mock(), self._issue_raw())
+        issue._session.put.return_value = mock_response(status_code=204)
+        updated = {**self._issue_raw(), "fields": {"summary": "New summary"}}
+        issue._session.get.return_value = mock_response(updated)
+
+        with patch("jira.resources.time.sleep") as sleep:
+            issue.update(summary="New summary", reload=reload)
+
+        issue._session.put.assert_called_once()
+        if reload:
+            sleep.assert_called_once_with(0.5)
+            issue._session.get.assert_called_once()
+            assert issue._session.get.call_args.args == (issue.self,)
+            assert issue.fields.summary == "New summary"
+        else:
+            sleep.assert_not_called()
+            issue._session.get.assert_not_called()
+            assert issue.fields.summary == "A summary"
+
+    def test_update_reload_by_default(self):
+        """Test the resource is fetched again after the update by default."""
+        issue = jira.resources.Issue(UPDATE_OPTIONS, Mock(), self._issue_raw())
+        issue._session.put.return_value = mock_response(status_code=204)
+        issue._session.get.return_value = mock_response(self._issue_raw())
+
+        issue.update(summary="New summary")
+
+        issue._session.get.assert_called_once()
+
+    def test_cls_for_resource_rebound_map(self, monkeypatch):
+        """Test a dict rebound to resource_class_map is used, and changes to it too."""
+
+        class Custom(jira.resources.UnknownResource):
+            pass
+
+        url = url_test_case("api/latest/custom/1")
+        issue_url = url_test_case("api/latest/issue/JRA-1330")
+        rebound = {r"issue/[^/]+$": jira.resources.Issue}
+        monkeypatch.setattr(jira.resources, "resource_class_map", rebound)
+        assert jira.resources.cls_for_resource(issue_url) == jira.resources.Issue
+        assert jira.resources.cls_for_resource(url) == jira.resources.UnknownResource
+
+        rebound[r"custom/[^/]+$"] = Custom
+        assert jira.resources.cls_for_resource(url) == Custom
+
+        monkeypatch.undo()
+        assert jira.resources.cls_for_resource(url) == jira.resources.UnknownResource
+        assert jira.resources.cls_for_resource(issue_url) == jira.resources.Issue
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import concurrent.futures
 import getpass
 import logging
+import threading
 from unittest import mock
 
 import pytest
@@ -407,3 +409,35 @@ def test_experimental_non_200_not_404_405(
 
     assert ex.value.status_code == status_code
     assert isinstance(ex.value, JIRAError)
+
+
+def test_async_do_without_session(mock_jira_client, caplog):
+    """Test waiting for jobs does nothing once there is no session."""
+    client = mock_jira_client()
+    assert client.async_do() is None
+    client._session = None
+    assert client.async_do() is None
+    assert not caplog.messages
+
+
+def test_async_do_waits_for_jobs(mock_jira_client):
+    """Test all the submitted jobs are finished and forgotten afterwards."""
+    client = mock_jira_client()
+    client._session = mock.Mock(_async_jobs=set())
+    release = threading.Event()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        jobs = {executor.submit(release.wait, 5) for _ in range(3)}
+        client._session._async_jobs.update(jobs)
+        threading.Timer(0.05, release.set).start()
+
+        client.async_do()
+
+        assert all(job.done() for job in jobs)
+        assert not client._session._async_jobs
+
+
+def test_async_do_size_deprecated(mock_jira_client):
+    """Test a size other than the default warns that it is ignored."""
+    client = mock_jira_client()
+    with pytest.warns(DeprecationWarning):
+        client.async_do(size=5)
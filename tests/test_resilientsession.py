@@ -236,3 +236,29 @@ def test_verify_is_forwarded(mocked_request_method: Mock):
     session.get(url="mocked_url", data={"some": "fake-data"})
     kwargs = mocked_request_method.call_args.kwargs
     assert kwargs["verify"] == session.verify is False
+
+
+@patch("requests.Session.request")
+def test_submit_async(mocked_request_method: Mock):
+    # Disable retries for this test.
+    session = jira.resilientsession.ResilientSession(max_retries=0)
+
+    future = session._submit_async("DELETE", "mocked_url", 2, params={"a": "b"})
+    future.result()
+    assert future in session._async_jobs
+    assert session._async_executor._max_workers == 2
+    args, kwargs = mocked_request_method.call_args
+    assert args == ("DELETE", "mocked_url")
+    assert kwargs["params"] == {"a": "b"}
+
+
+@patch("requests.Session.request")
+def test_close_shuts_down_async_pool(mocked_request_method: Mock):
+    session = jira.resilientsession.ResilientSession(max_retries=0)
+    session._submit_async("GET", "mocked_url").result()
+    executor = session._async_executor
+
+    session.close()
+
+    assert session._async_executor is None
+    assert executor._shutdown
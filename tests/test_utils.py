@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import Response
+
+import jira.utils
+from jira.utils import json_loads
+
+
+def _response(content: bytes, encoding: str | None = None) -> Response:
+    response = Response()
+    response.status_code = 200
+    response._content = content
+    response.encoding = encoding
+    return response
+
+
+@pytest.mark.parametrize(
+    ["content", "encoding", "expected"],
+    [
+        (b'{"key": "PRJ-1", "id": 10001}', None, {"key": "PRJ-1", "id": 10001}),
+        (b'{"key": "PRJ-1"}', "UTF-8", {"key": "PRJ-1"}),
+        (b"", None, {}),
+        (b'{"id": 18446744073709551615}', None, {"id": 18446744073709551615}),
+        (b'{"id": -9223372036854775808}', None, {"id": -9223372036854775808}),
+        ('{"name": "caf\xe9"}'.encode("latin-1"), "ISO-8859-1", {"name": "caf\xe9"}),
+        ('{"name": "caf\xe9"}'.encode("utf-16"), None, {"name": "caf\xe9"}),
+    ],
+    ids=[
+        "utf8",
+        "utf8_declared",
+        "empty",
+        "max_64_bit_int",
+        "min_64_bit_int",
+        "latin1_declared",
+        "utf16_guessed",
+    ],
+)
+def test_json_loads(content, encoding, expected):
+    """Test the body decodes the same way as with Response.json()."""
+    result = json_loads(_response(content, encoding))
+    assert result == expected
+    assert type(result) is type(expected)
+    if isinstance(expected, dict) and "id" in expected:
+        assert type(result["id"]) is int
+
+
+def test_json_loads_invalid():
+    """Test a body that is not json raises a ValueError."""
+    with pytest.raises(ValueError):
+        json_loads(_response(b"not json"))
+
+
+def test_json_loads_big_int_without_orjson():
+    """Test integers beyond 64 bits stay exact with the json module."""
+    with patch.object(jira.utils, "orjson", None):
+        result = json_loads(_response(b'{"id": 123456789012345678901234567890}'))
+    assert result == {"id": 123456789012345678901234567890}
+
+
+def test_json_loads_mocked_response():
+    """Test a mocked response falls back to its json() method."""
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {"key": "PRJ-1"}
+    assert json_loads(response) == {"key": "PRJ-1"}